@@ -1,14 +1,25 @@
+import csv
+from collections import defaultdict
+
 import streamlit as st
 from pathlib import Path
 import pandas as pd
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import ahocorasick
 import requests
-from bs4 import BeautifulSoup
-from transformers import pipeline
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from sumy.nlp.tokenizers import Tokenizer
+from sumy.parsers.plaintext import PlaintextParser
+from sumy.summarizers.lex_rank import LexRankSummarizer
 
 from questions import QUESTIONS, LIKERT_OPTIONS, YESNO_OPTIONS
 from scoring import compute_scores, generate_recommendations, get_category_weights
-from pdf_report import build_pdf_report
+from pdf_report import collect_pdf_report, submit_pdf_report
+from config import USE_BART_SUMMARISER
+from storage import insert_assessment, load_assessments
 
 CAT_LIST = [
     "Governance & Policy",
@@ -18,6 +29,11 @@ CAT_LIST = [
     "Organisational Readiness & Capability",
 ]
 
+# Questions grouped by category once, rather than re-scanned on every rerun
+QUESTIONS_BY_CAT = defaultdict(list)
+for _q in QUESTIONS:
+    QUESTIONS_BY_CAT[_q.category].append(_q)
+
 # ---------- Page config ----------
 st.set_page_config(
     page_title="Responsible AI Governance Readiness Assessment",
@@ -26,7 +42,130 @@ st.set_page_config(
 )
 
 
+# ---------- Keyword tables for text signals / website relevance ----------
+SIGNAL_KEYWORDS = {
+    "Governance & accountability": [
+        "governance",
+        "board",
+        "oversight",
+        "committee",
+        "risk",
+        "policy",
+        "framework",
+    ],
+    "Data protection & privacy": [
+        "gdpr",
+        "data protection",
+        "dpo",
+        "privacy",
+        "dpi",
+        "dpia",
+        "consent",
+        "data minimisation",
+        "retention",
+    ],
+    "Technical controls & monitoring": [
+        "monitoring",
+        "drift",
+        "versioning",
+        "mlflow",
+        "alert",
+        "testing",
+        "logging",
+        "audit log",
+    ],
+    "Ethics & societal impact": [
+        "ethics",
+        "ethical",
+        "fairness",
+        "bias",
+        "inclusion",
+        "impact assessment",
+        "human rights",
+    ],
+    "Organisational readiness & skills": [
+        "training",
+        "capability",
+        "upskilling",
+        "roles",
+        "accountabilities",
+        "centre of excellence",
+        "playbook",
+    ],
+}
+
+GOVERNANCE_KEYWORDS = [
+    "governance",
+    "board",
+    "oversight",
+    "risk",
+    "audit",
+    "compliance",
+    "regulator",
+    "policy",
+    "framework",
+    "ethics",
+    "responsible",
+    "ai",
+    "artificial intelligence",
+    "data protection",
+    "privacy",
+    "gdpr",
+    "dpo",
+    "impact assessment",
+    "dpi",
+    "dpia",
+]
+
+RED_FLAG_PHRASES = [
+    "no policy",
+    "not compliant",
+    "no governance",
+    "no oversight",
+    "no consent",
+]
+
+
+def _build_automaton(entries) -> "ahocorasick.Automaton":
+    """
+    Build an Aho–Corasick automaton from (keyword, value) pairs so every
+    keyword can be found in a single pass over the text.
+    """
+    automaton = ahocorasick.Automaton()
+    for kw, value in entries:
+        automaton.add_word(kw, value)
+    automaton.make_automaton()
+    return automaton
+
+
+# Values carry the keyword's position in its list so hits can be reported in list order
+SIGNAL_AC = _build_automaton(
+    (kw, (cat, idx, kw))
+    for cat, keywords in SIGNAL_KEYWORDS.items()
+    for idx, kw in enumerate(keywords)
+)
+GOVERNANCE_AC = _build_automaton((kw, kw) for kw in GOVERNANCE_KEYWORDS)
+RED_FLAG_AC = _build_automaton(
+    (phrase, (idx, phrase)) for idx, phrase in enumerate(RED_FLAG_PHRASES)
+)
+
+
 # ---------- Email / contacts storage ----------
+CONTACT_FIELDS = ["org_name", "email", "country", "industry", "source"]
+
+
+def _append_csv_row(path: Path, fieldnames: list, row: dict):
+    """
+    Append a single row to a CSV file, writing the header only when the file is new.
+    """
+    write_header = not path.exists()
+    with open(path, "a", buffering=1 << 16, newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        if write_header:
+            writer.writeheader()
+        writer.writerow(row)
+
+
 def store_contact(org_name: str, email: str, country: str, industry: str):
     """
     Append contact details to a local CSV file (docs/contacts.csv).
@@ -35,24 +174,16 @@ def store_contact(org_name: str, email: str, country: str, industry: str):
     if not email:
         return  # don't store empty emails
 
-    data = {
-        "org_name": [org_name or ""],
-        "email": [email],
-        "country": [country or ""],
-        "industry": [industry or ""],
-        "source": ["raigra_mvp"],
+    row = {
+        "org_name": org_name or "",
+        "email": email,
+        "country": country or "",
+        "industry": industry or "",
+        "source": "raigra_mvp",
     }
 
     contacts_path = Path("docs") / "contacts.csv"
-    df_new = pd.DataFrame(data)
-
-    if contacts_path.exists():
-        df_existing = pd.read_csv(contacts_path)
-        df_all = pd.concat([df_existing, df_new], ignore_index=True)
-    else:
-        df_all = df_new
-
-    df_all.to_csv(contacts_path, index=False)
+    _append_csv_row(contacts_path, CONTACT_FIELDS, row)
 
 def store_assessment(
     org_name: str,
@@ -65,13 +196,10 @@ def store_assessment(
     category_scores: dict,
 ):
     """
-    Append a single assessment record to docs/assessments.csv for historical tracking.
+    Append a single assessment record to docs/assessments.db for historical tracking.
     """
     from datetime import datetime
 
-    assessments_path = Path("docs") / "assessments.csv"
-    assessments_path.parent.mkdir(exist_ok=True, parents=True)
-
     row = {
         "timestamp": datetime.utcnow().isoformat(),
         "org_name": org_name or "",
@@ -88,16 +216,9 @@ def store_assessment(
         col_name = f"cat_{cat.replace(' ', '_').lower()}"
         row[col_name] = score
 
-    df_new = pd.DataFrame([row])
-
-    if assessments_path.exists():
-        df_existing = pd.read_csv(assessments_path)
-        df_all = pd.concat([df_existing, df_new], ignore_index=True)
-    else:
-        df_all = df_new
-
-    df_all.to_csv(assessments_path, index=False)
+    insert_assessment(row)
 
+@st.cache_data(max_entries=64)
 def analyse_text_signals(text: str) -> dict:
     """
     Very simple rule-based NLP to extract strengths and potential gaps
@@ -105,63 +226,16 @@ def analyse_text_signals(text: str) -> dict:
     """
     text_l = text.lower()
 
-    CAT_LIST = {
-        "Governance & accountability": [
-            "governance",
-            "board",
-            "oversight",
-            "committee",
-            "risk",
-            "policy",
-            "framework",
-        ],
-        "Data protection & privacy": [
-            "gdpr",
-            "data protection",
-            "dpo",
-            "privacy",
-            "dpi",
-            "dpia",
-            "consent",
-            "data minimisation",
-            "retention",
-        ],
-        "Technical controls & monitoring": [
-            "monitoring",
-            "drift",
-            "versioning",
-            "mlflow",
-            "alert",
-            "testing",
-            "logging",
-            "audit log",
-        ],
-        "Ethics & societal impact": [
-            "ethics",
-            "ethical",
-            "fairness",
-            "bias",
-            "inclusion",
-            "impact assessment",
-            "human rights",
-        ],
-        "Organisational readiness & skills": [
-            "training",
-            "capability",
-            "upskilling",
-            "roles",
-            "accountabilities",
-            "centre of excellence",
-            "playbook",
-        ],
-    }
-
     strengths = []
     gaps = []
     present = {}
 
-    for cat, keywords in CAT_LIST.items():
-        hits = [kw for kw in keywords if kw in text_l]
+    matched = {cat: set() for cat in SIGNAL_KEYWORDS}
+    for _, (cat, idx, kw) in SIGNAL_AC.iter(text_l):
+        matched[cat].add((idx, kw))
+
+    for cat, found in matched.items():
+        hits = [kw for _, kw in sorted(found)]
         present[cat] = len(hits) > 0
         if hits:
             strengths.append(f"Mentions {cat.lower()} (e.g. {', '.join(hits[:3])}).")
@@ -172,14 +246,8 @@ def analyse_text_signals(text: str) -> dict:
                 f"No explicit mention of {cat.lower()} – consider documenting how this is handled."
             )
 
-    red_flag_phrases = [
-        "no policy",
-        "not compliant",
-        "no governance",
-        "no oversight",
-        "no consent",
-    ]
-    red_hits = [p for p in red_flag_phrases if p in text_l]
+    red_found = {idx_phrase for _, idx_phrase in RED_FLAG_AC.iter(text_l)}
+    red_hits = [phrase for _, phrase in sorted(red_found)]
     for phrase in red_hits:
         gaps.append(
             f"Potential red flag phrase detected: '{phrase}' – this area may need urgent review."
@@ -192,152 +260,183 @@ def analyse_text_signals(text: str) -> dict:
 def get_summariser():
     """
     Load a summarisation pipeline once and reuse it.
+    Only used when USE_BART_SUMMARISER is enabled in config.py.
+
+    The model's Linear layers are dynamically quantised to INT8, which roughly
+    halves model size and speeds up CPU inference.
     """
+    # Heavy imports are deferred so the default extractive path never loads torch
+    import torch
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
+
+    model_name = "facebook/bart-large-cnn"
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+    model.eval()
+    model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
     return pipeline(
         "summarization",
-        model="facebook/bart-large-cnn",
-        tokenizer="facebook/bart-large-cnn",
+        model=model,
+        tokenizer=tokenizer,
     )
 
 
-from urllib.parse import urlparse, urljoin  # make sure this is at the top of app.py with your imports
+@st.cache_resource
+def get_extractive_summariser():
+    """
+    Build the LexRank summariser and sentence tokenizer once and reuse them.
+    """
+    try:
+        tokenizer = Tokenizer("english")
+    except LookupError:
+        # sumy relies on NLTK's punkt sentence models; fetch them on first use
+        import nltk
 
+        nltk.download("punkt", quiet=True)
+        nltk.download("punkt_tab", quiet=True)
+        tokenizer = Tokenizer("english")
+    return LexRankSummarizer(), tokenizer
 
-def scrape_and_summarise(url: str) -> str:
+
+def summarise_text(text: str, sentences_count: int = 5) -> str:
     """
-    Fetch key governance / privacy / AI-related pages for a site (where available),
-    extract the most relevant paragraph text, and return a short summary.
+    Summarise text with extractive LexRank by default, or with BART when
+    USE_BART_SUMMARISER is enabled.
+    """
+    if USE_BART_SUMMARISER:
+        summariser = get_summariser()
+        summary = summariser(
+            text,
+            max_length=240,
+            min_length=90,
+            num_beams=1,  # greedy decoding; BART defaults to 4 beams
+            do_sample=False,
+            truncation=True,
+        )
+        return summary[0]["summary_text"]
 
-    If we can't confidently extract anything useful, we fall back to a generic
-    governance / AI readiness overview instead of returning nothing.
+    summarizer, tokenizer = get_extractive_summariser()
+    parser = PlaintextParser.from_string(text, tokenizer)
+    return " ".join(str(s) for s in summarizer(parser.document, sentences_count=sentences_count))
+
+
+def _keyword_density(paragraph: str) -> float:
     """
-    try:
-        if not url:
-            return (
-                "No website URL was provided. This summary focuses on general AI governance "
-                "considerations rather than organisation-specific policies."
-            )
+    Governance keyword hits per character, used to rank paragraphs.
+    """
+    if not paragraph:
+        return 0.0
+    hits = sum(1 for _ in GOVERNANCE_AC.iter(paragraph.lower()))
+    return hits / len(paragraph)
 
-        # Normalise URL
-        if not url.startswith("http"):
-            url = "https://" + url.strip("/")
 
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            return (
-                "The URL provided does not appear to be valid. "
-                "This summary focuses on general AI governance considerations."
-            )
+def pack_for_summariser(paragraphs: list, rank: bool = False) -> str:
+    """
+    Greedily pack paragraphs into the summariser's input budget so no work is
+    spent on context the model would discard: ~1000 BART tokens, or 8000
+    characters for the extractive summariser.
 
-        base = f"{parsed.scheme}://{parsed.netloc}"
-
-        # Pages that are likely to contain governance / privacy / AI content
-        candidate_paths = [
-            "",  # homepage
-            "/privacy",
-            "/privacy-policy",
-            "/data",
-            "/data-protection",
-            "/governance",
-            "/corporate-governance",
-            "/responsible-ai",
-            "/ai",
-            "/ai-ethics",
-            "/ethics",
-            "/responsibility",
-            "/trust",
-            "/legal",
-            "/terms",
-        ]
-
-        governance_keywords = [
-            "governance",
-            "board",
-            "oversight",
-            "risk",
-            "audit",
-            "compliance",
-            "regulator",
-            "policy",
-            "framework",
-            "ethics",
-            "responsible",
-            "ai",
-            "artificial intelligence",
-            "data protection",
-            "privacy",
-            "gdpr",
-            "dpo",
-            "impact assessment",
-            "dpi",
-            "dpia",
-        ]
-
-        relevant_paragraphs = []
-        all_paragraphs = []
-
-        for path in candidate_paths:
-            full_url = urljoin(base, path)
-            try:
-                resp = requests.get(full_url, timeout=8)
-                if resp.status_code != 200:
-                    continue
+    With rank=True the most keyword-dense paragraphs are chosen first; the
+    chosen paragraphs are always joined in their original order.
+    """
+    if USE_BART_SUMMARISER:
+        tokenizer = get_summariser().tokenizer
+        budget = 1000
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-                paragraphs = [p.get_text(separator=" ").strip() for p in soup.find_all("p")]
-
-                for p_text in paragraphs:
-                    if not p_text:
-                        continue
-                    all_paragraphs.append(p_text)
-                    lower = p_text.lower()
-                    if any(kw in lower for kw in governance_keywords):
-                        relevant_paragraphs.append(p_text)
-            except Exception:
-                # If any individual page fails, just skip it and move on
-                continue
+        def cost(p: str) -> int:
+            return len(tokenizer.encode(p, add_special_tokens=False)) + 1
 
-        # Decide what text to summarise
-        if relevant_paragraphs:
-            # Best case: we found paragraphs that explicitly mention governance / AI / privacy
-            combined_text = " ".join(relevant_paragraphs)
-            source_note = (
-                "Summary based on governance, privacy, and AI-related sections found on the website "
-                "(e.g. privacy, data protection, governance, or ethics pages)."
-            )
-        elif len(" ".join(all_paragraphs)) > 600:
-            # Second best: we didn't find explicit keywords, but the site has enough text to summarise
-            combined_text = " ".join(all_paragraphs)
-            source_note = (
-                "Summary based on general website content; explicit governance or AI policy language "
-                "could not be confidently identified."
-            )
-        else:
-            # Fallback: barely any content, or nothing useful detected
-            return (
-                "We were unable to extract detailed governance or AI policy information from the website. "
-                "However, organisations considering AI deployment typically need to:\n\n"
-                "- Define clear governance structures and accountable owners for AI systems.\n"
-                "- Document data protection measures (e.g. legal basis, DPIAs, retention and minimisation).\n"
-                "- Monitor AI models for performance, drift, misuse, and unintended consequences.\n"
-                "- Consider ethics and societal impact, especially for high-risk use cases.\n"
-                "- Build organisational capability through training, playbooks, and clear roles.\n\n"
-                "You can use the rest of this report to prioritise which of these areas to formalise next."
-            )
+    else:
+        budget = 8000
 
-        # Truncate to a safe length for the summariser
-        if len(combined_text) > 8000:
-            combined_text = combined_text[:8000]
+        def cost(p: str) -> int:
+            return len(p) + 1
 
-        summariser = get_summariser()
-        summary = summariser(
-            combined_text,
-            max_length=240,
-            min_length=90,
-            do_sample=False,
+    order = list(range(len(paragraphs)))
+    if rank:
+        order.sort(key=lambda i: _keyword_density(paragraphs[i]), reverse=True)
+
+    chosen = []
+    used = 0
+    for i in order:
+        c = cost(paragraphs[i])
+        if used + c > budget:
+            continue
+        chosen.append(i)
+        used += c
+
+    if not chosen:
+        # Every paragraph is over budget on its own; fall back to a plain slice
+        return " ".join(paragraphs)[:8000]
+
+    return " ".join(paragraphs[i] for i in sorted(chosen))
+
+
+from urllib.parse import urlparse, urljoin, urlunparse  # make sure this is at the top of app.py with your imports
+
+
+ONLY_PARAGRAPHS = SoupStrainer("p")
+
+# Shared HTTP session so all candidate pages reuse pooled keep-alive connections
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=1)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+SESSION.headers.update(
+    {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+        ),
+    }
+)
+
+
+def _is_html_page(full_url: str) -> bool:
+    """
+    Cheaply check that a page exists and is HTML before downloading its body.
+    Servers that reject HEAD are probed with a one-byte ranged GET instead.
+    """
+    resp = SESSION.head(full_url, timeout=4, allow_redirects=True)
+    if resp.status_code in (405, 501):
+        resp = SESSION.get(full_url, timeout=4, headers={"Range": "bytes=0-0"}, stream=True)
+        resp.close()
+        exists = resp.status_code in (200, 206)
+    else:
+        exists = resp.status_code == 200
+    return exists and "html" in resp.headers.get("Content-Type", "")
+
+
+def _normalise_url(url: str) -> str:
+    """
+    Collapse equivalent spellings of a URL (case of host, trailing slash,
+    fragment) so they share a single cache entry.
+    """
+    url = (url or "").strip()
+    if not url:
+        return url
+    if not url.startswith("http"):
+        url = "https://" + url.strip("/")
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return url
+    return urlunparse(
+        parsed._replace(
+            netloc=parsed.netloc.lower(),
+            path=parsed.path.rstrip("/"),
+            fragment="",
         )
-        return summary[0]["summary_text"] + "\n\n" + source_note
+    )
 
+
+def scrape_and_summarise(url: str) -> str:
+    """
+    Normalise the URL and return the (cached) website governance summary.
+    Failures are handled here, outside the cache, so they are retried next time.
+    """
+    try:
+        return _scrape_and_summarise(_normalise_url(url))
     except Exception:
         # Absolute fallback: website unreachable or summariser failed
         return (
@@ -348,6 +447,155 @@ def scrape_and_summarise(url: str) -> str:
         )
 
 
+@st.cache_data(ttl=24 * 60 * 60, max_entries=128, show_spinner=False)
+def _scrape_and_summarise(url: str) -> str:
+    """
+    Fetch key governance / privacy / AI-related pages for a site (where available),
+    extract the most relevant paragraph text, and return a short summary.
+
+    If we can't confidently extract anything useful, we fall back to a generic
+    governance / AI readiness overview instead of returning nothing. Raises when
+    no page could be fetched at all, so transient failures are not cached.
+    """
+    if not url:
+        return (
+            "No website URL was provided. This summary focuses on general AI governance "
+            "considerations rather than organisation-specific policies."
+        )
+
+    # Normalise URL
+    if not url.startswith("http"):
+        url = "https://" + url.strip("/")
+
+    parsed = urlparse(url)
+    if not parsed.scheme or not parsed.netloc:
+        return (
+            "The URL provided does not appear to be valid. "
+            "This summary focuses on general AI governance considerations."
+        )
+
+    base = f"{parsed.scheme}://{parsed.netloc}"
+
+    # Pages that are likely to contain governance / privacy / AI content,
+    # highest-yield first so an early exit keeps the most useful pages
+    candidate_paths = [
+        "",  # homepage
+        "/privacy",
+        "/responsible-ai",
+        "/governance",
+        "/privacy-policy",
+        "/data",
+        "/data-protection",
+        "/corporate-governance",
+        "/ai",
+        "/ai-ethics",
+        "/ethics",
+        "/responsibility",
+        "/trust",
+        "/legal",
+        "/terms",
+    ]
+
+    def _fetch(path: str):
+        """
+        Fetch a single candidate page and return (all_paras, rel_paras),
+        or None if it could not be retrieved so the page is skipped.
+        """
+        all_paras = []
+        rel_paras = []
+        full_url = urljoin(base, path)
+        try:
+            if not _is_html_page(full_url):
+                return None
+
+            resp = SESSION.get(full_url, timeout=8)
+            if resp.status_code != 200:
+                return None
+
+            # Only <p> subtrees are used, so skip building the rest of the DOM
+            soup = BeautifulSoup(resp.text, "lxml", parse_only=ONLY_PARAGRAPHS)
+            paragraphs = [p.get_text(separator=" ").strip() for p in soup.find_all("p")]
+
+            for p_text in paragraphs:
+                if not p_text:
+                    continue
+                all_paras.append(p_text)
+                lower = p_text.lower()
+                if next(GOVERNANCE_AC.iter(lower), None) is not None:
+                    rel_paras.append(p_text)
+        except Exception:
+            # If any individual page fails, just skip it and move on
+            return None
+        return all_paras, rel_paras
+
+    relevant_paragraphs = []
+    all_paragraphs = []
+
+    # Fetch candidate pages in parallel and stop as soon as we have enough
+    # governance text; pages still queued are cancelled.
+    results = {}
+    relevant_chars = 0
+    relevant_count = 0
+    executor = ThreadPoolExecutor(max_workers=8)
+    try:
+        futures = {executor.submit(_fetch, path): idx for idx, path in enumerate(candidate_paths)}
+        for future in as_completed(futures):
+            page = future.result()
+            if page is None:
+                continue
+            all_paras, rel_paras = page
+            results[futures[future]] = (all_paras, rel_paras)
+            relevant_chars += sum(len(p) for p in rel_paras)
+            relevant_count += len(rel_paras)
+            if relevant_chars >= 6000 or relevant_count >= 40:
+                break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if not results:
+        raise RuntimeError(f"No pages could be fetched from {base}")
+
+    # Merge in candidate-path order so the summary input is deterministic.
+    # all_chars tracks the length of " ".join(all_paragraphs) without building it.
+    all_chars = -1
+    for idx in sorted(results):
+        all_paras, rel_paras = results[idx]
+        all_paragraphs.extend(all_paras)
+        relevant_paragraphs.extend(rel_paras)
+        all_chars += sum(len(p) + 1 for p in all_paras)
+
+    # Decide what text to summarise
+    if relevant_paragraphs:
+        # Best case: we found paragraphs that explicitly mention governance / AI / privacy
+        combined_text = pack_for_summariser(relevant_paragraphs, rank=True)
+        source_note = (
+            "Summary based on governance, privacy, and AI-related sections found on the website "
+            "(e.g. privacy, data protection, governance, or ethics pages)."
+        )
+    elif all_chars > 600:
+        # Second best: we didn't find explicit keywords, but the site has enough text to summarise
+        combined_text = pack_for_summariser(all_paragraphs)
+        source_note = (
+            "Summary based on general website content; explicit governance or AI policy language "
+            "could not be confidently identified."
+        )
+    else:
+        # Fallback: barely any content, or nothing useful detected
+        return (
+            "We were unable to extract detailed governance or AI policy information from the website. "
+            "However, organisations considering AI deployment typically need to:\n\n"
+            "- Define clear governance structures and accountable owners for AI systems.\n"
+            "- Document data protection measures (e.g. legal basis, DPIAs, retention and minimisation).\n"
+            "- Monitor AI models for performance, drift, misuse, and unintended consequences.\n"
+            "- Consider ethics and societal impact, especially for high-risk use cases.\n"
+            "- Build organisational capability through training, playbooks, and clear roles.\n\n"
+            "You can use the rest of this report to prioritise which of these areas to formalise next."
+        )
+
+    summary = summarise_text(combined_text)
+    return summary + "\n\n" + source_note
+
+
 # ---------- Main app ----------
 
 def main():
@@ -465,29 +713,31 @@ def main():
 
     responses = {}
 
-    # QUESTIONS
-    for cat in CAT_LIST:
-        with st.expander(cat, expanded=True):
-            for q in [q for q in QUESTIONS if q.category == cat]:
-                if q.qtype == "likert":
-                    label = st.select_slider(
-                        q.text,
-                        options=list(LIKERT_OPTIONS.keys()),
-                        value="Developing",
-                    )
-                    responses[q.id] = LIKERT_OPTIONS[label]
-                elif q.qtype == "yesno":
-                    label = st.radio(
-                        q.text,
-                        options=list(YESNO_OPTIONS.keys()),
-                        horizontal=True,
-                    )
-                    responses[q.id] = YESNO_OPTIONS[label]
+    # QUESTIONS – batched in a form so widget changes don't rerun the script
+    with st.form("assessment_form"):
+        for cat in CAT_LIST:
+            with st.expander(cat, expanded=True):
+                for q in QUESTIONS_BY_CAT[cat]:
+                    if q.qtype == "likert":
+                        label = st.select_slider(
+                            q.text,
+                            options=list(LIKERT_OPTIONS.keys()),
+                            value="Developing",
+                        )
+                        responses[q.id] = LIKERT_OPTIONS[label]
+                    elif q.qtype == "yesno":
+                        label = st.radio(
+                            q.text,
+                            options=list(YESNO_OPTIONS.keys()),
+                            horizontal=True,
+                        )
+                        responses[q.id] = YESNO_OPTIONS[label]
 
-    st.markdown("---")
+        st.markdown("---")
+        submitted = st.form_submit_button("Generate readiness score and summary", type="primary")
 
     # BUTTON + RESULTS
-    if st.button("Generate readiness score and summary", type="primary"):
+    if submitted:
 
         # Validation of mandatory fields
         missing_fields = []
@@ -553,8 +803,7 @@ def main():
         # Results header
         st.markdown("## Results overview")
 
-        # Weighting explanation
-        from scoring import get_category_weights
+        # Weighting explanation (cached from compute_scores above)
         weights = get_category_weights(org_type, industry)
         top_two = sorted(weights.items(), key=lambda x: x[1], reverse=True)[:2]
         st.caption(
@@ -586,14 +835,12 @@ def main():
 
         # Category scores
         st.markdown("### Category scores")
-        for cat in CAT_LIST:
-            st.progress(min(int(category_scores.get(cat, 0)), 100))
-            st.write(f"**{cat}**: {category_scores.get(cat, 0):.1f}/100")
+        scores_series = pd.Series(category_scores).reindex(CAT_LIST).fillna(0).clip(0, 100)
+        st.bar_chart(scores_series, horizontal=True)
 
         # Recommendations
         st.markdown("### High-level recommendations")
-        for cat, text in recs.items():
-            st.write(f"**{cat}** — {text}")
+        st.markdown("\n\n".join(f"**{cat}** — {text}" for cat, text in recs.items()))
 
         # Text-based AI governance insights
         st.markdown("### Text-based governance signals")
@@ -611,8 +858,8 @@ def main():
             for g in gaps:
                 st.write(f"- {g}")
 
-        # PDF report
-        pdf_buffer = build_pdf_report(
+        # PDF report – built in a worker process while the rest of the page renders
+        pdf_kwargs = dict(
             org_name=org_name,
             org_type=org_type,
             industry=industry,
@@ -627,97 +874,84 @@ def main():
             governance_summary=governance_summary,
             text_insights=text_insights,  
         )
+        pdf_future = submit_pdf_report(**pdf_kwargs)
 
                  # Historical tracking – show previous assessments for this org/email
-        assessments_path = Path("docs") / "assessments.csv"
-        if assessments_path.exists():
-            df_all = pd.read_csv(assessments_path)
-
-            # Prefer to filter by email (more unique), fall back to org_name
-            if email:
-                df_org = df_all[df_all["email"] == email]
-            elif org_name:
-                df_org = df_all[df_all["org_name"] == org_name]
-            else:
-                df_org = df_all.copy()
-
-            if len(df_org) > 0:
-                st.markdown("### Previous assessments for this organisation")
-
-                # Sort by timestamp
-                df_org = df_org.sort_values("timestamp")
-
-                # Change since last assessment (overall score)
-                if len(df_org) >= 2:
-                    last_two = df_org.tail(2)
-                    prev_score = last_two["overall_score"].iloc[0]
-                    latest_score = last_two["overall_score"].iloc[1]
-                    delta = latest_score - prev_score
-
-                    st.markdown("#### Change since last assessment")
-                    st.metric(
-                        label="Overall readiness change",
-                        value=f"{latest_score:.1f}/100",
-                        delta=f"{delta:+.1f} points",
-                    )
-                    st.caption(
-                        f"Overall readiness changed by {delta:+.1f} points between the last two assessments "
-                        f"({prev_score:.1f} → {latest_score:.1f} on a 0–100 scale)."
-                    )
+        # Prefer to filter by email (more unique), fall back to org_name
+        df_org = load_assessments(email=email, org_name=org_name)
+        df_org["timestamp"] = pd.to_datetime(df_org["timestamp"])
+        if len(df_org) > 0:
+            st.markdown("### Previous assessments for this organisation")
+
+            # Change since last assessment (overall score)
+            if len(df_org) >= 2:
+                last_two = df_org.tail(2)
+                prev_score = last_two["overall_score"].iloc[0]
+                latest_score = last_two["overall_score"].iloc[1]
+                delta = latest_score - prev_score
+
+                st.markdown("#### Change since last assessment")
+                st.metric(
+                    label="Overall readiness change",
+                    value=f"{latest_score:.1f}/100",
+                    delta=f"{delta:+.1f} points",
+                )
+                st.caption(
+                    f"Overall readiness changed by {delta:+.1f} points between the last two assessments "
+                    f"({prev_score:.1f} → {latest_score:.1f} on a 0–100 scale)."
+                )
+
+            st.dataframe(
+                df_org[
+                    [
+                        "timestamp",
+                        "overall_score",
+                        "band",
+                        "org_type",
+                        "industry",
+                    ]
+                ],
+                use_container_width=True,
+            )
+
+            # Trend chart for overall score
+            if len(df_org) > 1:
+                df_trend = df_org.set_index("timestamp")
 
-                st.dataframe(
-                    df_org[
-                        [
-                            "timestamp",
-                            "overall_score",
-                            "band",
-                            "org_type",
-                            "industry",
-                        ]
-                    ],
+                st.markdown("#### Overall readiness trend")
+                st.line_chart(
+                    df_trend["overall_score"],
                     use_container_width=True,
                 )
 
-                # Trend chart for overall score
-                if len(df_org) > 1:
-                    df_trend = df_org.copy()
-                    df_trend["timestamp"] = pd.to_datetime(df_trend["timestamp"])
-                    df_trend = df_trend.set_index("timestamp")
+                # Per-category trend (choose a category to inspect)
+                st.markdown("#### Category trend (select area to inspect)")
+                selected_cat = st.selectbox(
+                    "Category",
+                    options=CAT_LIST,
+                    key="trend_category_select",
+                )
 
-                    st.markdown("#### Overall readiness trend")
+                cat_col = "cat_" + selected_cat.replace(" ", "_").lower()
+
+                if cat_col in df_trend.columns:
                     st.line_chart(
-                        df_trend["overall_score"],
+                        df_trend[cat_col],
                         use_container_width=True,
                     )
-
-                    # Per-category trend (choose a category to inspect)
-                    st.markdown("#### Category trend (select area to inspect)")
-                    selected_cat = st.selectbox(
-                        "Category",
-                        options=CAT_LIST,
-                        key="trend_category_select",
+                else:
+                    st.info(
+                        "No historical data stored yet for this category column. "
+                        "Run a few more assessments to populate the trend."
                     )
 
-                    cat_col = "cat_" + selected_cat.replace(" ", "_").lower()
-
-                    if cat_col in df_trend.columns:
-                        st.line_chart(
-                            df_trend[cat_col],
-                            use_container_width=True,
-                        )
-                    else:
-                        st.info(
-                            "No historical data stored yet for this category column. "
-                            "Run a few more assessments to populate the trend."
-                        )
-
         # Final export CTA – PDF at the very bottom
         st.markdown("---")
         st.markdown("### Export your results")
 
         st.download_button(
             "📄 Download full PDF report",
-            data=pdf_buffer,
+            data=collect_pdf_report(pdf_future, **pdf_kwargs),
             file_name="ai_readiness_report.pdf",
             mime="application/pdf",
         )
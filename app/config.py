@@ -14,3 +14,7 @@ READINESS_BANDS = [
     (40, 59, "Emerging", "Foundational elements in place but significant weaknesses."),
     (0, 39, "High Risk", "Limited governance; urgent remediation required."),
 ]
+
+# Website summaries use extractive LexRank by default; set to True to use the
+# (much heavier) facebook/bart-large-cnn abstractive summariser instead.
+USE_BART_SUMMARISER = False
@@ -1,10 +1,16 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import groupby
 from io import BytesIO
-from typing import Dict, Optional
-
-from pathlib import Path
+from typing import BinaryIO, Dict, Optional
+from xml.sax.saxutils import escape
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import (
@@ -13,10 +19,14 @@ from reportlab.platypus import (
     Spacer,
     Table,
     TableStyle,
-    Image,
 )
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib import colors
+from reportlab.graphics.charts.lineplots import LinePlot
+from reportlab.graphics.shapes import Drawing, Group, String, rotate
+from reportlab.graphics.widgets.markers import makeMarker
+
+from storage import CATEGORY_COLUMNS, ensure_database, load_assessments
 
 CAT_LIST = [
     "Governance & Policy",
@@ -33,6 +43,76 @@ BAND_STYLES = {
     "Ready": {"colour": colors.green, "label": "Ready"},
 }
 
+# Category table status labels and row colours, indexed by status
+STATUS_LABELS = ("Strength", "Developing", "Priority gap")
+STATUS_BACKGROUNDS = (
+    colors.HexColor("#E6F4EA"),  # light green
+    colors.HexColor("#FFF4E5"),  # light amber
+    colors.HexColor("#FDECEA"),  # light red
+)
+
+TREND_COLUMNS = ["timestamp", "overall_score", *CATEGORY_COLUMNS]
+
+# (category, stored column name) pairs, in CAT_LIST order
+CAT_COL_NAMES = tuple("cat_" + c.replace(" ", "_").lower() for c in CAT_LIST)
+CAT_PAIRS = tuple(zip(CAT_LIST, CAT_COL_NAMES))
+
+
+@lru_cache(maxsize=1)
+def _cached_styles():
+    """
+    Build the sample stylesheet once; it is only read while composing reports.
+    """
+    return getSampleStyleSheet()
+
+
+def _trend_drawing(timestamps: list, scores: list, width: int = 400, height: int = 250) -> Drawing:
+    """
+    Draw the overall readiness trend as a vector line chart (no raster image).
+    Timestamps are placed proportionally on the x axis, labelled as dates.
+    """
+    t0 = timestamps[0]
+    xs = [(ts - t0).total_seconds() / 86400.0 for ts in timestamps]
+
+    drawing = Drawing(width, height)
+
+    plot = LinePlot()
+    plot.x, plot.y = 50, 45
+    plot.width, plot.height = width - 70, height - 85
+    plot.data = [list(zip(xs, scores))]
+    plot.lines[0].strokeColor = colors.HexColor("#1F77B4")
+    plot.lines[0].strokeWidth = 1.5
+    plot.lines[0].symbol = makeMarker("FilledCircle", size=4)
+
+    plot.yValueAxis.valueMin = 0
+    plot.yValueAxis.valueMax = 100
+    plot.yValueAxis.valueStep = 20
+    plot.yValueAxis.visibleGrid = True
+    plot.yValueAxis.gridStrokeColor = colors.lightgrey
+    plot.yValueAxis.labels.fontName = "Helvetica"
+    plot.yValueAxis.labels.fontSize = 7
+
+    plot.xValueAxis.valueMin = 0
+    plot.xValueAxis.valueMax = max(xs[-1], 1.0)
+    plot.xValueAxis.visibleGrid = True
+    plot.xValueAxis.gridStrokeColor = colors.lightgrey
+    plot.xValueAxis.labels.fontName = "Helvetica"
+    plot.xValueAxis.labels.fontSize = 7
+    # Show times as well when the history spans only a few days
+    tick_fmt = "%d %b %y" if xs[-1] >= 3 else "%d %b %H:%M"
+    plot.xValueAxis.labelTextFormat = lambda d: (t0 + pd.Timedelta(days=d)).strftime(tick_fmt)
+    drawing.add(plot)
+
+    label_style = {"fontName": "Helvetica", "textAnchor": "middle"}
+    drawing.add(String(width / 2, height - 18, "Overall readiness trend", fontSize=10, **label_style))
+    drawing.add(String(plot.x + plot.width / 2, 8, "Assessment date/time", fontSize=8, **label_style))
+    y_label = Group(String(0, 0, "Score (0–100)", fontSize=8, **label_style))
+    y_label.transform = rotate(90)
+    y_label.translate(plot.y + plot.height / 2, -14)
+    drawing.add(y_label)
+    return drawing
+
+
 def build_pdf_report(
     org_name: str,
     org_type: str,
@@ -48,14 +128,16 @@ def build_pdf_report(
     governance_summary: Optional[str] = None,
     text_insights: Optional[dict] = None,
     regulatory_note: Optional[str] = None,
-) -> BytesIO:
+    output: Optional[BinaryIO] = None,
+) -> Optional[BytesIO]:
     """
     Build a simple, consulting-style PDF report and return it as a BytesIO buffer.
+
+    If output is given (an open binary file, response stream, ...) the PDF is
+    written straight to it instead and None is returned.
     """
 
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4)
-    styles = getSampleStyleSheet()
+    styles = _cached_styles()
     elements = []
 
     title = "AI Governance Readiness Report"
@@ -97,14 +179,15 @@ def build_pdf_report(
 
     # Organisation profile
     elements.append(Paragraph("Organisation profile", styles["Heading2"]))
-    profile_lines = [
-        f"<b>Type:</b> {org_type}",
-        f"<b>Sector:</b> {industry}",
-        f"<b>Country / region:</b> {country or 'Not specified'}",
-        f"<b>Contact email:</b> {email or 'Not provided'}",
-    ]
-    for line in profile_lines:
-        elements.append(Paragraph(line, styles["Normal"]))
+    profile_html = "<br/>".join(
+        [
+            f"<b>Type:</b> {escape(org_type or '')}",
+            f"<b>Sector:</b> {escape(industry or '')}",
+            f"<b>Country / region:</b> {escape(country or 'Not specified')}",
+            f"<b>Contact email:</b> {escape(email or 'Not provided')}",
+        ]
+    )
+    elements.append(Paragraph(profile_html, styles["Normal"]))
     if context_text:
         elements.append(Spacer(1, 6))
         elements.append(Paragraph("<b>AI context (self-described):</b>", styles["Normal"]))
@@ -132,37 +215,39 @@ def build_pdf_report(
 
         if strengths:
             elements.append(Paragraph("<b>Detected strengths:</b>", styles["Normal"]))
-            for s in strengths:
-                elements.append(Paragraph(f"• {s}", styles["Normal"]))
+            elements.append(
+                Paragraph("<br/>".join(f"• {escape(s)}" for s in strengths), styles["Normal"])
+            )
             elements.append(Spacer(1, 6))
 
         if gaps:
             elements.append(Paragraph("<b>Potential gaps or blind spots:</b>", styles["Normal"]))
-            for g in gaps:
-                elements.append(Paragraph(f"• {g}", styles["Normal"]))
+            elements.append(
+                Paragraph("<br/>".join(f"• {escape(g)}" for g in gaps), styles["Normal"])
+            )
             elements.append(Spacer(1, 12))
 
     # Category scores table
     elements.append(Paragraph("Category scores", styles["Heading2"]))
 
-    # Build a table of category scores with simple traffic-light styling
-    table_data = [["Category", "Score (0–100)", "Status"]]
-    row_styles = []
-
-    for idx, (cat, score) in enumerate(category_scores.items(), start=1):
-        status = "Strength" if score >= 75 else "Developing" if score >= 50 else "Priority gap"
-
-        table_data.append([cat, f"{score:.1f}", status])
+    # Build a table of category scores with simple traffic-light styling:
+    # one vectorised pass picks each row's status (0=Strength, 1=Developing, 2=Priority gap)
+    cats = list(category_scores.keys())
+    scores = np.fromiter(category_scores.values(), dtype=np.float64, count=len(cats))
+    status_idx = np.select([scores >= 75, scores >= 50], [0, 1], default=2)
 
-        # Row colour: light green / amber / red based on status
-        if score >= 75:
-            bg = colors.HexColor("#E6F4EA")  # light green
-        elif score >= 50:
-            bg = colors.HexColor("#FFF4E5")  # light amber
-        else:
-            bg = colors.HexColor("#FDECEA")  # light red
+    table_data = [["Category", "Score (0–100)", "Status"]] + [
+        [cat, f"{score:.1f}", STATUS_LABELS[i]]
+        for cat, score, i in zip(cats, scores, status_idx)
+    ]
 
-        row_styles.append(("BACKGROUND", (0, idx), (-1, idx), bg))
+    # One BACKGROUND command per run of consecutive rows sharing a status
+    row_styles = []
+    row = 1
+    for i, run in groupby(status_idx):
+        run_len = sum(1 for _ in run)
+        row_styles.append(("BACKGROUND", (0, row), (-1, row + run_len - 1), STATUS_BACKGROUNDS[i]))
+        row += run_len
 
     cat_table = Table(table_data, hAlign="LEFT")
     cat_table_style = [
@@ -181,46 +266,34 @@ def build_pdf_report(
 
     # Recommendations
     elements.append(Paragraph("High-level recommendations", styles["Heading2"]))
-    for cat, text in recommendations.items():
-        elements.append(Paragraph(f"<b>{cat}</b>", styles["Normal"]))
-        elements.append(Paragraph(text, styles["Normal"]))
+    recs_html = "<br/><br/>".join(
+        f"<b>{escape(cat)}</b><br/>{escape(text)}" for cat, text in recommendations.items()
+    )
+    if recs_html:
+        elements.append(Paragraph(recs_html, styles["Normal"]))
         elements.append(Spacer(1, 4))
 
     # Historical trend (if available)
     try:
-        assessments_path = Path("docs") / "assessments.csv"
-        if assessments_path.exists() and email:
-            df_all = pd.read_csv(assessments_path)
-
-            df_org = df_all[df_all["email"] == email]
+        if email and ensure_database():
+            df_org = load_assessments(email=email, columns=TREND_COLUMNS)
+            df_org["timestamp"] = pd.to_datetime(df_org["timestamp"])
             if len(df_org) >= 2:
-                df_org = df_org.sort_values("timestamp")
-
                 # --- Overall readiness trend chart ---
-                fig, ax = plt.subplots(figsize=(5, 3))
-                ax.plot(
-                    pd.to_datetime(df_org["timestamp"]),
-                    df_org["overall_score"],
-                    marker="o",
-                )
-                ax.set_title("Overall readiness trend")
-                ax.set_xlabel("Assessment date/time")
-                ax.set_ylabel("Score (0–100)")
-                ax.grid(True)
-
-                img_buffer = BytesIO()
-                plt.tight_layout()
-                fig.savefig(img_buffer, format="PNG")
-                plt.close(fig)
-                img_buffer.seek(0)
+                df_plot = df_org.iloc[-20:]  # rows are timestamp-ordered; plot the latest 20
 
                 elements.append(Spacer(1, 12))
                 elements.append(Paragraph("Historical readiness trend", styles["Heading2"]))
-                elements.append(Image(img_buffer, width=400, height=250))
+                elements.append(
+                    _trend_drawing(
+                        df_plot["timestamp"].tolist(),
+                        df_plot["overall_score"].tolist(),
+                    )
+                )
                 elements.append(Spacer(1, 8))
 
                 # --- Overall change since last assessment ---
-                last_two = df_org.tail(2)
+                last_two = df_org.iloc[-2:]
                 prev_overall = last_two["overall_score"].iloc[0]
                 latest_overall = last_two["overall_score"].iloc[1]
                 delta_overall = latest_overall - prev_overall
@@ -236,16 +309,14 @@ def build_pdf_report(
                 elements.append(Spacer(1, 8))
 
                 # --- Category trend summary table (latest vs previous) ---
-                latest = df_org.iloc[-1]
-                previous = df_org.iloc[-2]
-
                 table_data = [["Category", "Latest score", "Change vs previous"]]
 
-                for cat in CAT_LIST:
-                    col_name = "cat_" + cat.replace(" ", "_").lower()
-                    if col_name in df_org.columns:
-                        latest_val = latest.get(col_name, None)
-                        prev_val = previous.get(col_name, None)
+                col_set = set(df_org.columns)
+                for cat, col_name in CAT_PAIRS:
+                    if col_name in col_set:
+                        col_idx = df_org.columns.get_loc(col_name)
+                        latest_val = df_org.iat[-1, col_idx]
+                        prev_val = df_org.iat[-2, col_idx]
                         if pd.notna(latest_val) and pd.notna(prev_val):
                             delta_cat = latest_val - prev_val
                             table_data.append(
@@ -291,6 +362,80 @@ def build_pdf_report(
         )
     )
 
+    return _render_pdf(elements, output)
+
+
+def _render_pdf(elements: list, output: Optional[BinaryIO] = None) -> Optional[BytesIO]:
+    """
+    Lay out the composed flowables into a PDF, writing to output if given,
+    otherwise to a fresh BytesIO buffer which is returned.
+    """
+    sink = output if output is not None else BytesIO()
+    doc = SimpleDocTemplate(sink, pagesize=A4)
     doc.build(elements)
-    buffer.seek(0)
-    return buffer
+    if output is not None:
+        return None
+    sink.seek(0)
+    return sink
+
+
+# ---------- Background report synthesis ----------
+
+PDF_POOL_MAX_WORKERS = 2
+
+
+@lru_cache(maxsize=1)
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """
+    Process pool for PDF synthesis, created on first use. "spawn" is used rather
+    than "fork" because the Streamlit server is multi-threaded. Kept small, as
+    each worker is a full interpreter with ReportLab and pandas loaded.
+    """
+    return ProcessPoolExecutor(
+        max_workers=min(PDF_POOL_MAX_WORKERS, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def _build_pdf_bytes(**kwargs) -> bytes:
+    # Runs in a worker process; only plain arguments and bytes cross the boundary
+    return build_pdf_report(**kwargs).getvalue()
+
+
+async def build_pdf_report_async(**kwargs) -> Optional[BytesIO]:
+    """
+    Async wrapper for build_pdf_report that runs it on a worker thread so an
+    event loop can keep serving other requests.
+    """
+    return await asyncio.to_thread(build_pdf_report, **kwargs)
+
+
+def submit_pdf_report(**kwargs) -> "Future[bytes]":
+    """
+    Build a PDF report in a worker process. Accepts the same keyword arguments
+    as build_pdf_report and returns a Future resolving to the PDF bytes.
+    Falls back to building inline if the pool is broken, and replaces it.
+    """
+    pool = get_pdf_pool()
+    try:
+        return pool.submit(_build_pdf_bytes, **kwargs)
+    except BrokenProcessPool:
+        get_pdf_pool.cache_clear()
+        pool.shutdown(wait=False)
+        future: "Future[bytes]" = Future()
+        future.set_result(_build_pdf_bytes(**kwargs))
+        return future
+
+
+def collect_pdf_report(future: "Future[bytes]", **kwargs) -> bytes:
+    """
+    Wait for a report from submit_pdf_report. If its worker died the pool is
+    replaced and the report is rebuilt inline from the same keyword arguments.
+    """
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        # A pool whose worker died rejects all further work; drop it so the
+        # next submit starts a fresh one
+        get_pdf_pool.cache_clear()
+        return _build_pdf_bytes(**kwargs)
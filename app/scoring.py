@@ -1,6 +1,9 @@
 # app/scoring.py
 
+from bisect import bisect_right
 from collections import defaultdict
+
+import numpy as np
 from typing import Dict, Tuple
 
 from config import CATEGORY_WEIGHTS, READINESS_BANDS
@@ -11,109 +14,102 @@ def normalise_category_score(raw_sum: float, max_sum: float) -> float:
         return 0.0
     return (raw_sum / max_sum) * 100.0
 
+# Band lower bounds (inclusive) and the band for each interval they delimit
+_BAND_THRESHOLDS = (40, 60, 80)
+_BAND_VALUES = (
+    ("High Risk", "Limited governance; urgent remediation required."),
+    ("Emerging", "Foundational elements in place but significant weaknesses."),
+    ("Near Ready", "Solid foundation with clear areas to strengthen."),
+    ("AI Ready", "Strong governance and controls; low regulatory risk."),
+)
+
 def classify_band(overall_score: float) -> Tuple[str, str]:
     """
     Map a numeric score to a qualitative band.
     Uses inclusive lower bounds and open upper bounds for non-top band.
     """
-    if overall_score >= 80:
-        return "AI Ready", "Strong governance and controls; low regulatory risk."
-    elif overall_score >= 60:
-        return "Near Ready", "Solid foundation with clear areas to strengthen."
-    elif overall_score >= 40:
-        return "Emerging", "Foundational elements in place but significant weaknesses."
-    else:
-        return "High Risk", "Limited governance; urgent remediation required."
+    return _BAND_VALUES[bisect_right(_BAND_THRESHOLDS, overall_score)]
 
-from typing import Dict, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
 from questions import CATEGORIES
 
 
-def get_category_weights(org_type: str | None, industry: str | None) -> Dict[str, float]:
+@lru_cache(maxsize=None)
+def get_category_weights(org_type: str | None, industry: str | None) -> Mapping[str, float]:
     """
     Return category weights that adapt to organisation type AND sector.
 
-    Base mapping (by category order in CATEGORIES):
-        0: Governance & Policy
-        1: Data Privacy & Protection
-        2: Technical Controls & Monitoring
-        3: Ethics & Societal Impact
-        4: Organisational Readiness & Capability
+    Results are memoised per (org_type, industry) and returned as a read-only
+    mapping so callers can't mutate the cached value.
     """
-    # Base weights
-    weights = {
-        CATEGORIES[0]: 0.30,  # Governance
-        CATEGORIES[1]: 0.25,  # Privacy
-        CATEGORIES[2]: 0.20,  # Technical controls
-        CATEGORIES[3]: 0.15,  # Ethics & impact
-        CATEGORIES[4]: 0.10,  # Org readiness
-    }
+    return MappingProxyType(_compute_category_weights(org_type, industry))
 
-    t = (org_type or "").lower()
-    ind = (industry or "").lower()
 
-    # --- 1. Organisation type adjustments (broad risk posture) ---
+# Base weights, in CATEGORIES order:
+#   Governance, Privacy, Technical controls, Ethics & impact, Org readiness
+_BASE_WEIGHTS = np.array([0.30, 0.25, 0.20, 0.15, 0.10])
 
+# Weight adjustments as (field, keywords, delta vector in CATEGORIES order).
+# field selects whether keywords are matched against org type or industry.
+_ADJUST_RULES = (
+    # --- 1. Organisation type adjustments (broad risk posture) ---
     # Public sector / government / NGO – governance + privacy more important
-    if any(k in t for k in ["public", "government", "gov", "ngo", "non-profit", "charity"]):
-        weights[CATEGORIES[0]] += 0.05  # governance
-        weights[CATEGORIES[1]] += 0.05  # privacy
-        weights[CATEGORIES[2]] -= 0.05  # technical
-        weights[CATEGORIES[4]] -= 0.05  # org capability
-
+    ("org_type", ("public", "government", "gov", "ngo", "non-profit", "charity"),
+     np.array([+0.05, +0.05, -0.05, 0.00, -0.05])),
     # Startup / scaleup – technical + organisational readiness more important
-    if any(k in t for k in ["startup", "scaleup", "scale-up", "high growth"]):
-        weights[CATEGORIES[2]] += 0.05  # technical
-        weights[CATEGORIES[4]] += 0.05  # org readiness
-        weights[CATEGORIES[0]] -= 0.03  # governance
-        weights[CATEGORIES[3]] -= 0.02  # ethics
-
+    ("org_type", ("startup", "scaleup", "scale-up", "high growth"),
+     np.array([-0.03, 0.00, +0.05, -0.02, +0.05])),
     # --- 2. Industry-specific adjustments (more granular) ---
-
     # Healthcare / life sciences – privacy + ethics heavily weighted
-    if "health" in ind or "life science" in ind or "pharma" in ind:
-        weights[CATEGORIES[1]] += 0.06  # privacy
-        weights[CATEGORIES[3]] += 0.04  # ethics
-        weights[CATEGORIES[2]] -= 0.05  # technical
-        weights[CATEGORIES[4]] -= 0.05  # org
-
+    ("industry", ("health", "life science", "pharma"),
+     np.array([0.00, +0.06, -0.05, +0.04, -0.05])),
     # Financial services – governance + privacy dominant
-    if "financ" in ind or "bank" in ind or "insur" in ind or "asset" in ind:
-        weights[CATEGORIES[0]] += 0.05  # governance
-        weights[CATEGORIES[1]] += 0.05  # privacy
-        weights[CATEGORIES[2]] -= 0.05
-        weights[CATEGORIES[3]] -= 0.05
-
+    ("industry", ("financ", "bank", "insur", "asset"),
+     np.array([+0.05, +0.05, -0.05, -0.05, 0.00])),
     # Retail / e-commerce – technical + org capability dominant
-    if "retail" in ind or "commerce" in ind or "e-commerce" in ind or "ecommerce" in ind:
-        weights[CATEGORIES[2]] += 0.06  # technical
-        weights[CATEGORIES[4]] += 0.04  # org
-        weights[CATEGORIES[0]] -= 0.05
-        weights[CATEGORIES[3]] -= 0.05
-
+    ("industry", ("retail", "commerce", "e-commerce", "ecommerce"),
+     np.array([-0.05, 0.00, +0.06, -0.05, +0.04])),
     # Education – governance, ethics, and org readiness more important
-    if "educat" in ind or "school" in ind or "university" in ind or "college" in ind:
-        weights[CATEGORIES[0]] += 0.04  # governance
-        weights[CATEGORIES[3]] += 0.04  # ethics
-        weights[CATEGORIES[4]] += 0.02  # org
-        weights[CATEGORIES[1]] -= 0.05
-        weights[CATEGORIES[2]] -= 0.05
-
+    ("industry", ("educat", "school", "university", "college"),
+     np.array([+0.04, -0.05, -0.05, +0.04, +0.02])),
     # Technology / AI / software vendors – technical + governance
-    if "tech" in ind or "software" in ind or "ai" in ind or "digital" in ind:
-        weights[CATEGORIES[2]] += 0.05  # technical
-        weights[CATEGORIES[0]] += 0.03  # governance
-        weights[CATEGORIES[3]] -= 0.03
-        weights[CATEGORIES[1]] -= 0.05
+    ("industry", ("tech", "software", "ai", "digital"),
+     np.array([+0.03, -0.05, +0.05, -0.03, 0.00])),
+)
+
+
+def _compute_category_weights(org_type: str | None, industry: str | None) -> Dict[str, float]:
+    """
+    Compute category weights for an organisation type and sector by applying
+    every matching rule in _ADJUST_RULES to the base weights.
+    """
+    text = {
+        "org_type": (org_type or "").lower(),
+        "industry": (industry or "").lower(),
+    }
+
+    weights = _BASE_WEIGHTS.copy()
+    for field, keywords, delta in _ADJUST_RULES:
+        value = text[field]
+        if any(k in value for k in keywords):
+            weights += delta
 
     # Normalise back to sum to 1.0
-    total = sum(weights.values())
+    total = weights.sum()
     if total <= 0:
         # Fallback to equal weights in a weird edge case
         n = len(CATEGORIES)
         return {cat: 1.0 / n for cat in CATEGORIES}
 
-    return {k: v / total for k, v in weights.items()}
+    return dict(zip(CATEGORIES, (weights / total).tolist()))
+
+# Question ids per category, built once at import
+_QIDS_BY_CAT: Dict[str, list] = {
+    cat: [q.id for q in QUESTIONS if q.category == cat] for cat in CATEGORIES
+}
+
 
 def compute_scores(
     responses: Dict[str, float],
@@ -124,23 +120,13 @@ def compute_scores(
     Compute per-category scores and an overall readiness score.
     Weights adapt based on organisation type and sector.
     """
-    # Initialise totals per category
-    category_totals: Dict[str, float] = {cat: 0.0 for cat in CATEGORIES}
-    category_counts: Dict[str, int] = {cat: 0 for cat in CATEGORIES}
-
-    # Aggregate responses per category
-    from questions import QUESTIONS  # local import to avoid circulars
-    for q in QUESTIONS:
-        if q.id in responses:
-            category_totals[q.category] += responses[q.id]
-            category_counts[q.category] += 1
-
     # Average scores per category (0–100)
     category_scores: Dict[str, float] = {}
-    for cat in CATEGORIES:
-        if category_counts[cat] > 0:
+    for cat, qids in _QIDS_BY_CAT.items():
+        answered = [responses[qid] for qid in qids if qid in responses]
+        if answered:
             # Each question is on a 0–4 scale; scale up to 0–100
-            avg = category_totals[cat] / category_counts[cat]
+            avg = sum(answered) / len(answered)
             category_scores[cat] = (avg / 4.0) * 100.0
         else:
             category_scores[cat] = 0.0
@@ -0,0 +1,164 @@
+# app/storage.py
+
+import atexit
+import sqlite3
+import threading
+from contextlib import closing
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Sequence
+
+import pandas as pd
+
+from questions import CATEGORIES
+
+ASSESSMENTS_DB_PATH = Path("docs") / "assessments.db"
+LEGACY_ASSESSMENTS_CSV = Path("docs") / "assessments.csv"
+
+CATEGORY_COLUMNS = [f"cat_{cat.replace(' ', '_').lower()}" for cat in CATEGORIES]
+
+# Fixed column order for stored assessments
+ASSESSMENT_COLUMNS = [
+    "timestamp",
+    "org_name",
+    "org_type",
+    "industry",
+    "country",
+    "email",
+    "overall_score",
+    "band",
+] + CATEGORY_COLUMNS
+
+_REAL_COLUMNS = {"overall_score", *CATEGORY_COLUMNS}
+
+
+def _quote(col: str) -> str:
+    # Category column names contain "&", so identifiers are always quoted
+    return '"' + col.replace('"', '""') + '"'
+
+
+_INSERT_SQL = "INSERT INTO assessments ({cols}) VALUES ({placeholders})".format(
+    cols=", ".join(_quote(c) for c in ASSESSMENT_COLUMNS),
+    placeholders=", ".join("?" for _ in ASSESSMENT_COLUMNS),
+)
+
+
+def _create_schema(conn: sqlite3.Connection):
+    cols = ", ".join(
+        f"{_quote(c)} {'REAL' if c in _REAL_COLUMNS else 'TEXT'}" for c in ASSESSMENT_COLUMNS
+    )
+    conn.execute(f"CREATE TABLE IF NOT EXISTS assessments ({cols})")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_assessments_email ON assessments(email, timestamp)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_assessments_org ON assessments(org_name, timestamp)"
+    )
+
+
+def _import_legacy_csv(conn: sqlite3.Connection, csv_path: Path):
+    """
+    One-off migration of rows from the old docs/assessments.csv history file.
+    """
+    df = pd.read_csv(csv_path, dtype={"email": "string", "org_name": "string"})
+    df = df.reindex(columns=ASSESSMENT_COLUMNS).astype(object)
+    df = df.where(df.notna(), None)
+    # executemany rather than to_sql, which commits and would end the
+    # caller's transaction part-way through the migration
+    conn.executemany(_INSERT_SQL, df.itertuples(index=False, name=None))
+
+
+def _table_exists(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'assessments'"
+    ).fetchone() is not None
+
+
+def get_connection(path: Path = ASSESSMENTS_DB_PATH, **kwargs) -> sqlite3.Connection:
+    """
+    Open the assessments database, creating the table (and importing any
+    legacy CSV history) the first time it is used.
+    """
+    path.parent.mkdir(exist_ok=True, parents=True)
+    conn = sqlite3.connect(path, **kwargs)
+    if _table_exists(conn):
+        return conn
+    # Several sessions can open a fresh database at once: take the write lock
+    # up front and re-check, so only one of them creates the table and the
+    # legacy import runs exactly once.
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        if not _table_exists(conn):
+            _create_schema(conn)
+            if LEGACY_ASSESSMENTS_CSV.exists():
+                _import_legacy_csv(conn, LEGACY_ASSESSMENTS_CSV)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        conn.close()
+        raise
+    return conn
+
+
+def ensure_database(path: Path = ASSESSMENTS_DB_PATH) -> bool:
+    """
+    Make sure the database exists, migrating legacy CSV history if that is all
+    there is. Returns False when there is no history at all.
+    """
+    if path.exists():
+        return True
+    if not LEGACY_ASSESSMENTS_CSV.exists():
+        return False
+    get_connection(path).close()
+    return True
+
+
+_WRITE_LOCK = threading.Lock()
+
+@lru_cache(maxsize=None)
+def get_writer_connection(path: Path = ASSESSMENTS_DB_PATH) -> sqlite3.Connection:
+    """
+    Return a long-lived connection for inserts, shared across Streamlit sessions
+    (guarded by _WRITE_LOCK) and closed when the process exits.
+    """
+    conn = get_connection(path, check_same_thread=False)
+    atexit.register(conn.close)
+    return conn
+
+
+def insert_assessment(row: dict, path: Path = ASSESSMENTS_DB_PATH):
+    """
+    Insert a single assessment record.
+    """
+    values = [row.get(c) for c in ASSESSMENT_COLUMNS]
+    with _WRITE_LOCK:
+        # Fetched under the lock so concurrent first inserts share one connection
+        conn = get_writer_connection(path)
+        with conn:
+            conn.execute(_INSERT_SQL, values)
+
+
+def load_assessments(
+    email: Optional[str] = None,
+    org_name: Optional[str] = None,
+    path: Path = ASSESSMENTS_DB_PATH,
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Return stored assessments ordered by timestamp.
+    Filters by email when given (more unique), otherwise by organisation name;
+    with neither, all assessments are returned. Pass columns to fetch only a subset.
+    """
+    cols = ", ".join(_quote(c) for c in (columns or ASSESSMENT_COLUMNS))
+    query = f"SELECT {cols} FROM assessments"
+    params: tuple = ()
+    if email:
+        query += " WHERE email = ?"
+        params = (email,)
+    elif org_name:
+        query += " WHERE org_name = ?"
+        params = (org_name,)
+    query += " ORDER BY timestamp"
+
+    with closing(get_connection(path)) as conn:
+        return pd.read_sql_query(query, conn, params=params)
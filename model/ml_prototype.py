@@ -1,68 +1,115 @@
 # model/ml_prototype.py
 
+import hashlib
+
+import joblib
 import numpy as np
 import pandas as pd
+import sklearn
 from pathlib import Path
 
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score
-from sklearn.ensemble import RandomForestRegressor
-import matplotlib.pyplot as plt
+from sklearn.ensemble import HistGradientBoostingRegressor
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+FEATURE_COLUMNS = ["governance", "privacy", "technical", "ethics", "org_capability"]
+FEATURE_WEIGHTS = np.array([0.30, 0.25, 0.20, 0.15, 0.10])
 
 
 def generate_synthetic_data(n_samples: int = 1000, random_state: int = 42) -> pd.DataFrame:
     rng = np.random.default_rng(random_state)
 
-    data = {
-        "governance": rng.integers(1, 6, size=n_samples),
-        "privacy": rng.integers(1, 6, size=n_samples),
-        "technical": rng.integers(1, 6, size=n_samples),
-        "ethics": rng.integers(1, 6, size=n_samples),
-        "org_capability": rng.integers(1, 6, size=n_samples),
-        "org_size": rng.choice([0, 1, 2], size=n_samples),  # 0=small, 1=medium, 2=large
-    }
-
-    df = pd.DataFrame(data)
-
-    base_score = (
-        0.30 * df["governance"]
-        + 0.25 * df["privacy"]
-        + 0.20 * df["technical"]
-        + 0.15 * df["ethics"]
-        + 0.10 * df["org_capability"]
-    )
+    # One (5, n) draw consumes the generator exactly like five per-column draws,
+    # so datasets stay identical for a given random_state.
+    features = rng.integers(1, 6, size=(len(FEATURE_COLUMNS), n_samples)).astype(np.int8).T
+    org_size = rng.choice([0, 1, 2], size=n_samples)  # 0=small, 1=medium, 2=large
 
-    score = base_score / 5.0 * 100.0
+    score = (features @ FEATURE_WEIGHTS) * (100.0 / 5.0)
     noise = rng.normal(0, 5, size=n_samples)
+
+    df = pd.DataFrame(features, columns=FEATURE_COLUMNS)
+    df["org_size"] = org_size
     df["readiness_score"] = np.clip(score + noise, 0, 100)
 
     return df
 
 
-def train_model(df: pd.DataFrame):
+def _split(df: pd.DataFrame):
     X = df.drop(columns=["readiness_score"])
     y = df["readiness_score"]
+    return train_test_split(X, y, test_size=0.2, random_state=42)
+
+
+def _evaluate(model, X_test, y_test):
+    y_pred = model.predict(X_test)
+    rmse = mean_squared_error(y_test, y_pred) ** 0.5
+    r2 = r2_score(y_test, y_pred)
+    return y_pred, rmse, r2
 
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42
-    )
 
-    model = RandomForestRegressor(
-        n_estimators=300,
+def make_model(X: pd.DataFrame) -> HistGradientBoostingRegressor:
+    # Histogram-based boosting bins the small integer features, so it fits much
+    # faster than a 300-tree random forest on this data.
+    return HistGradientBoostingRegressor(
+        max_iter=200,
         max_depth=5,
+        learning_rate=0.1,
+        categorical_features=[X.columns.get_loc("org_size")],
         random_state=42,
-        n_jobs=-1,
     )
 
+
+def train_model(df: pd.DataFrame):
+    X_train, X_test, y_train, y_test = _split(df)
+
+    model = make_model(X_train)
     model.fit(X_train, y_train)
 
-    y_pred = model.predict(X_test)
-    rmse = mean_squared_error(y_test, y_pred) ** 0.5
-    r2 = r2_score(y_test, y_pred)
+    y_pred, rmse, r2 = _evaluate(model, X_test, y_test)
 
     return model, X_test, y_test, y_pred, rmse, r2
 
 
+def training_digest(df: pd.DataFrame, model) -> str:
+    """
+    Hash of everything that determines a fitted model: the dataset, the
+    estimator class and hyperparameters, and the scikit-learn version.
+    Used to decide whether a persisted model is stale.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    h.update(f"{type(model).__module__}.{type(model).__qualname__}".encode())
+    h.update(repr(sorted(model.get_params().items())).encode())
+    h.update(sklearn.__version__.encode())
+    return h.hexdigest()
+
+
+def load_or_train_model(df: pd.DataFrame, model_path: Path):
+    """
+    Reuse the model persisted at model_path if it was trained on this exact data
+    with the same estimator configuration, otherwise train a new one and persist
+    it. Returns the same tuple as train_model.
+    """
+    digest = training_digest(df, make_model(df.drop(columns=["readiness_score"])))
+
+    if model_path.exists():
+        try:
+            model, cached_digest = joblib.load(model_path)
+        except Exception:
+            model, cached_digest = None, None
+        if cached_digest == digest:
+            _, X_test, _, y_test = _split(df)
+            y_pred, rmse, r2 = _evaluate(model, X_test, y_test)
+            return model, X_test, y_test, y_pred, rmse, r2
+
+    result = train_model(df)
+    joblib.dump((result[0], digest), model_path, compress=3)
+    return result
+
+
 def main():
     out_dir = Path("model")
     out_dir.mkdir(exist_ok=True, parents=True)
@@ -72,21 +119,24 @@ def main():
     df.to_csv(csv_path, index=False)
     print(f"Saved synthetic dataset to {csv_path}")
 
-    model, X_test, y_test, y_pred, rmse, r2 = train_model(df)
+    model_path = out_dir / "readiness_model.joblib"
+    model, X_test, y_test, y_pred, rmse, r2 = load_or_train_model(df, model_path)
     print(f"RMSE: {rmse:.2f}")
     print(f"R²:   {r2:.3f}")
 
-    plt.figure(figsize=(6, 6))
-    plt.scatter(y_test, y_pred, alpha=0.6)
-    plt.plot([0, 100], [0, 100], "r--")
-    plt.xlabel("True readiness score")
-    plt.ylabel("Predicted readiness score")
-    plt.title("Random Forest readiness model – true vs predicted")
-    plt.grid(True)
+    fig = Figure(figsize=(6, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.scatter(y_test, y_pred, alpha=0.6)
+    ax.plot([0, 100], [0, 100], "r--")
+    ax.set_xlabel("True readiness score")
+    ax.set_ylabel("Predicted readiness score")
+    ax.set_title("Gradient boosting readiness model – true vs predicted")
+    ax.grid(True)
 
     plot_path = Path("docs") / "ml_scatter.png"
     plot_path.parent.mkdir(exist_ok=True, parents=True)
-    plt.savefig(plot_path, bbox_inches="tight")
+    fig.savefig(plot_path, bbox_inches="tight")
     print(f"Saved diagnostic plot to {plot_path}")
 
 